@@ -0,0 +1,124 @@
+"""Vectorised evaluation of every detector over a whole poll."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from detectors.fake_bin import fake_bin_alert
+from detectors.kernels import run_all
+from detectors.spike import spike_alert
+from detectors.underpriced import underpriced_alert
+from utils.jit import HAS_NUMBA
+
+
+@dataclass
+class BatchHits:
+    """Per-row hit masks and metrics produced by :func:`evaluate_batch`."""
+
+    underpriced: np.ndarray
+    fake_bin: np.ndarray
+    spike: np.ndarray
+    expected: np.ndarray
+    discount: np.ndarray
+    score: np.ndarray
+    spike_pct: np.ndarray
+
+    @property
+    def any_hit(self) -> np.ndarray:
+        return self.underpriced | self.fake_bin | self.spike
+
+    def alerts(self, i: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """Return ``(detector_name, info)`` pairs for row ``i`` in detector order."""
+
+        expected = float(self.expected[i])
+        found: List[Tuple[str, Dict[str, Any]]] = []
+        if self.underpriced[i]:
+            score = float(self.score[i])
+            found.append((
+                "UNDERPRICED",
+                underpriced_alert(float(self.discount[i]), None if np.isnan(score) else score, expected),
+            ))
+        if self.fake_bin[i]:
+            found.append(("FAKE_BIN", fake_bin_alert(float(self.discount[i]), expected)))
+        if self.spike[i]:
+            found.append(("SPIKE", spike_alert(float(self.spike_pct[i]), expected)))
+        return found
+
+
+def evaluate_batch(
+    price: np.ndarray,
+    avg: np.ndarray,
+    std: np.ndarray,
+    min_discount: float,
+    neg_zscore_min: float,
+    fake_drop_pct: float,
+    fake_drop_ceiling: float,
+    spike_pct: float,
+) -> BatchHits:
+    """Run the three detectors over columnar ``price``/``avg``/``std`` arrays.
+
+    Thresholds arrive as plain floats already specialised by the caller:
+    ``neg_zscore_min`` is ``-zscore_min`` and ``fake_drop_ceiling`` is
+    ``fake_drop_pct + STD_NOISE_MARGIN``.
+
+    Missing values must be encoded as ``NaN`` (``price``/``avg``) or ``0.0``
+    (``std``).  Prices are truncated to whole coins exactly like the scalar
+    ``detect_*`` functions so both paths agree row by row.  With Numba the
+    fused :func:`detectors.kernels.run_all` kernel is used; otherwise the
+    same predicates are evaluated as NumPy array expressions.
+    """
+
+    price = np.trunc(price)
+    if HAS_NUMBA:
+        n = price.shape[0]
+        hits = BatchHits(
+            underpriced=np.empty(n, dtype=np.bool_),
+            fake_bin=np.empty(n, dtype=np.bool_),
+            spike=np.empty(n, dtype=np.bool_),
+            expected=avg,
+            discount=np.empty(n, dtype=np.float64),
+            score=np.empty(n, dtype=np.float64),
+            spike_pct=np.empty(n, dtype=np.float64),
+        )
+        run_all(
+            price,
+            avg,
+            std,
+            min_discount,
+            neg_zscore_min,
+            fake_drop_pct,
+            fake_drop_ceiling,
+            spike_pct,
+            hits.underpriced,
+            hits.fake_bin,
+            hits.spike,
+            hits.discount,
+            hits.score,
+            hits.spike_pct,
+        )
+        return hits
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        valid = (price > 0) & (avg > 0)
+        ratio = price / avg
+        discount = 1.0 - ratio
+        spike = ratio - 1.0
+        has_std = std > 0
+        score = np.where(has_std, (price - avg) / np.where(has_std, std, 1.0), np.nan)
+
+        underpriced = valid & (discount >= min_discount) & ~(has_std & (score > neg_zscore_min))
+        # Quando existe desvio considerável o alerta tende a ser ruído
+        fake_bin = valid & (discount >= fake_drop_pct) & ~(has_std & (discount < fake_drop_ceiling))
+        hit_spike = valid & (spike >= spike_pct)
+
+    return BatchHits(
+        underpriced=underpriced,
+        fake_bin=fake_bin,
+        spike=hit_spike,
+        expected=avg,
+        discount=discount,
+        score=score,
+        spike_pct=spike,
+    )
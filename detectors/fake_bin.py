@@ -2,10 +2,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from utils.jit import FASTMATH, njit
 
 
 def _to_float(value: Any) -> Optional[float]:
+    # Caminho rápido: valores já numéricos dispensam o try
+    if value.__class__ is float:
+        return value
+    if value.__class__ is int:
+        return float(value)
     if value in (None, ""):
         return None
     try:
@@ -15,6 +22,10 @@ def _to_float(value: Any) -> Optional[float]:
 
 
 def _to_int(value: Any) -> Optional[int]:
+    if value.__class__ is int:
+        return value
+    if value.__class__ is float:
+        return int(value) if value == value else None
     if value in (None, ""):
         return None
     try:
@@ -23,11 +34,33 @@ def _to_int(value: Any) -> Optional[int]:
         return None
 
 
+# Acima de ``fake_drop_pct`` + margem o alerta vale mesmo com desvio
+STD_NOISE_MARGIN = 0.05
+
+
 @dataclass
 class FakeBinConfig:
     fake_drop_pct: float
 
 
+@njit("Tuple((b1, f8))(f8, f8, f8, f8, f8)", cache=True, fastmath=FASTMATH)
+def _fake_bin_kernel(
+    price: float, avg: float, std: float, fake_drop_pct: float, fake_drop_ceiling: float
+) -> Tuple[bool, float]:
+    """Return ``(is_hit, drop_pct)``.
+
+    ``fake_drop_ceiling`` is ``fake_drop_pct + STD_NOISE_MARGIN``.
+    """
+
+    drop_pct = 1.0 - (price / avg)
+    if drop_pct < fake_drop_pct:
+        return False, drop_pct
+    if std > 0 and drop_pct < fake_drop_ceiling:
+        # Quando existe desvio considerável o alerta tende a ser ruído
+        return False, drop_pct
+    return True, drop_pct
+
+
 def detect_fake_bin(row: Dict[str, Any], cfg: FakeBinConfig) -> Optional[Dict[str, Any]]:
     price = _to_int(row.get("price"))
     avg = _to_float(row.get("avg_price_24h"))
@@ -36,16 +69,19 @@ def detect_fake_bin(row: Dict[str, Any], cfg: FakeBinConfig) -> Optional[Dict[st
     if not price or not avg:
         return None
 
-    drop_pct = 1 - (price / avg)
-    if drop_pct < cfg.fake_drop_pct:
+    is_hit, drop_pct = _fake_bin_kernel(
+        float(price), avg, std, cfg.fake_drop_pct, cfg.fake_drop_pct + STD_NOISE_MARGIN
+    )
+    if not is_hit:
         return None
+    return fake_bin_alert(drop_pct, avg)
 
-    if std > 0 and drop_pct < (cfg.fake_drop_pct + 0.05):
-        # Quando existe desvio considerável o alerta tende a ser ruído
-        return None
+
+def fake_bin_alert(drop_pct: float, expected: float) -> Dict[str, Any]:
+    """Build the alert payload for a fake BIN suspect."""
 
     return {
         "type": "FAKE_BIN_SUSPECT",
         "drop_pct": drop_pct,
-        "expected": avg,
+        "expected": expected,
     }
@@ -0,0 +1,55 @@
+"""Fused Numba kernel running every detector in a single pass."""
+from __future__ import annotations
+
+import numpy as np
+
+from detectors.fake_bin import _fake_bin_kernel
+from detectors.spike import _spike_kernel
+from detectors.underpriced import _underpriced_kernel
+from utils.jit import FASTMATH, njit, prange
+
+
+@njit(parallel=True, fastmath=FASTMATH, cache=True)
+def run_all(
+    price: np.ndarray,
+    avg: np.ndarray,
+    std: np.ndarray,
+    min_discount: float,
+    neg_zscore_min: float,
+    fake_drop_pct: float,
+    fake_drop_ceiling: float,
+    spike_pct: float,
+    hit_u: np.ndarray,
+    hit_f: np.ndarray,
+    hit_s: np.ndarray,
+    discount: np.ndarray,
+    score: np.ndarray,
+    spike: np.ndarray,
+) -> None:
+    """Fill the hit/metric output arrays for every row of ``price``/``avg``/``std``.
+
+    Rows are independent, so the loop is split across threads with
+    ``prange``; each row's inputs are loaded once and shared by the three
+    detector kernels.  Only worth calling when Numba is available.
+    """
+
+    for i in prange(price.shape[0]):
+        p = price[i]
+        a = avg[i]
+        s = std[i]
+        hit_u[i] = False
+        hit_f[i] = False
+        hit_s[i] = False
+        discount[i] = np.nan
+        score[i] = np.nan
+        spike[i] = np.nan
+        if p > 0 and a > 0:
+            is_u, d, z = _underpriced_kernel(p, a, s, min_discount, neg_zscore_min)
+            is_f, _ = _fake_bin_kernel(p, a, s, fake_drop_pct, fake_drop_ceiling)
+            is_s, sp = _spike_kernel(p, a, spike_pct)
+            hit_u[i] = is_u
+            hit_f[i] = is_f
+            hit_s[i] = is_s
+            discount[i] = d
+            score[i] = z
+            spike[i] = sp
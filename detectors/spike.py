@@ -2,10 +2,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from utils.jit import FASTMATH, njit
 
 
 def _to_float(value: Any) -> Optional[float]:
+    # Caminho rápido: valores já numéricos dispensam o try
+    if value.__class__ is float:
+        return value
+    if value.__class__ is int:
+        return float(value)
     if value in (None, ""):
         return None
     try:
@@ -15,6 +22,10 @@ def _to_float(value: Any) -> Optional[float]:
 
 
 def _to_int(value: Any) -> Optional[int]:
+    if value.__class__ is int:
+        return value
+    if value.__class__ is float:
+        return int(value) if value == value else None
     if value in (None, ""):
         return None
     try:
@@ -28,18 +39,31 @@ class SpikeConfig:
     spike_pct: float
 
 
+@njit("Tuple((b1, f8))(f8, f8, f8)", cache=True, fastmath=FASTMATH)
+def _spike_kernel(price: float, avg: float, spike_pct: float) -> Tuple[bool, float]:
+    """Return ``(is_hit, spike)``."""
+
+    spike = (price / avg) - 1.0
+    return spike >= spike_pct, spike
+
+
 def detect_spike(row: Dict[str, Any], cfg: SpikeConfig) -> Optional[Dict[str, Any]]:
     price = _to_int(row.get("price"))
     avg = _to_float(row.get("avg_price_24h"))
     if not price or not avg:
         return None
 
-    spike = (price / avg) - 1
-    if spike < cfg.spike_pct:
+    is_hit, spike = _spike_kernel(float(price), avg, cfg.spike_pct)
+    if not is_hit:
         return None
+    return spike_alert(spike, avg)
+
+
+def spike_alert(spike_pct: float, expected: float) -> Dict[str, Any]:
+    """Build the alert payload for a price spike."""
 
     return {
         "type": "SPIKE",
-        "spike_pct": spike,
-        "expected": avg,
+        "spike_pct": spike_pct,
+        "expected": expected,
     }
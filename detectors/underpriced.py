@@ -1,11 +1,19 @@
 """Underpriced detector."""
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from utils.jit import FASTMATH, njit
 
 
 def _to_float(value: Any) -> Optional[float]:
+    # Caminho rápido: valores já numéricos dispensam o try
+    if value.__class__ is float:
+        return value
+    if value.__class__ is int:
+        return float(value)
     if value in (None, ""):
         return None
     try:
@@ -15,6 +23,10 @@ def _to_float(value: Any) -> Optional[float]:
 
 
 def _to_int(value: Any) -> Optional[int]:
+    if value.__class__ is int:
+        return value
+    if value.__class__ is float:
+        return int(value) if value == value else None
     if value in (None, ""):
         return None
     try:
@@ -29,6 +41,24 @@ class UnderpricedConfig:
     zscore_min: float
 
 
+@njit("Tuple((b1, f8, f8))(f8, f8, f8, f8, f8)", cache=True, fastmath=FASTMATH)
+def _underpriced_kernel(
+    price: float, avg: float, std: float, min_discount: float, neg_zscore_min: float
+) -> Tuple[bool, float, float]:
+    """Return ``(is_hit, discount, score)``; ``score`` is NaN without ``std``.
+
+    ``neg_zscore_min`` is ``-zscore_min``, negated once by the caller.
+    """
+
+    discount = 1.0 - (price / avg)
+    if discount < min_discount:
+        return False, discount, math.nan
+    if std > 0:
+        score = (price - avg) / std
+        return score <= neg_zscore_min, discount, score
+    return True, discount, math.nan
+
+
 def detect_underpriced(row: Dict[str, Any], cfg: UnderpricedConfig) -> Optional[Dict[str, Any]]:
     price = _to_int(row.get("price"))
     avg = _to_float(row.get("avg_price_24h"))
@@ -37,19 +67,20 @@ def detect_underpriced(row: Dict[str, Any], cfg: UnderpricedConfig) -> Optional[
     if not price or not avg:
         return None
 
-    discount = 1 - (price / avg)
-    if discount < cfg.min_discount:
+    is_hit, discount, score = _underpriced_kernel(
+        float(price), avg, std or 0.0, cfg.min_discount, -cfg.zscore_min
+    )
+    if not is_hit:
         return None
+    return underpriced_alert(discount, None if math.isnan(score) else score, avg)
 
-    score = None
-    if std and std > 0:
-        score = (price - avg) / std
-        if score > -cfg.zscore_min:
-            return None
+
+def underpriced_alert(discount: float, score: Optional[float], expected: float) -> Dict[str, Any]:
+    """Build the alert payload for an underpriced hit."""
 
     return {
         "type": "UNDERPRICED",
         "discount_pct": discount,
         "score": round(score, 2) if score is not None else None,
-        "expected": avg,
+        "expected": expected,
     }
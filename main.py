@@ -1,17 +1,22 @@
 from __future__ import annotations
 import os, time, yaml
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 from dotenv import load_dotenv
 
+try:  # pragma: no cover - depends on the environment
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the environment
+    from yaml import SafeLoader as _YamlLoader
+
 from utils.logging_setup import setup_logger
 from sources.futwiz_scraper import FutwizScraper, FutwizScraperConfig
-from detectors.underpriced import detect_underpriced, UnderpricedConfig
-from detectors.fake_bin import detect_fake_bin, FakeBinConfig
-from detectors.spike import detect_spike, SpikeConfig
-from notifier.discord_webhook import send_discord_message
+from detectors.fake_bin import STD_NOISE_MARGIN
+from detectors.batch import evaluate_batch
+from notifier.discord_webhook import send_discord_messages
 from storage.state import AlertState
-from storage.price_history import PriceHistory
+from storage.price_history import PriceHistory, PriceStats
 
 load_dotenv()
 log = setup_logger()
@@ -34,6 +39,8 @@ class Config:
     futwiz_backoff_factor: float
     futwiz_extra_headers: Dict[str, str]
     futwiz_proxies: Dict[str, str]
+    futwiz_parse_workers: int
+    futwiz_max_concurrent_pages: int
     history_window_minutes: int
     history_max_points: int
     history_min_points: int
@@ -63,13 +70,26 @@ def _ensure_mapping(value: Any) -> Dict[str, Any]:
     return {}
 
 
+# (caminho, mtime_ns) -> Config já parseada
+_CONFIG_CACHE: Dict[Tuple[str, int], Config] = {}
+
 def load_config() -> Config:
     path = "config.yaml"
     if not os.path.exists(path):
         log.warning("config.yaml não encontrado, usando config.example.yaml")
         path = "config.example.yaml"
+    key = (path, os.stat(path).st_mtime_ns)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None:
+        return cached
     with open(path, "r", encoding="utf-8") as f:
-        y = yaml.safe_load(f) or {}
+        y = yaml.load(f, Loader=_YamlLoader) or {}
+    _CONFIG_CACHE.clear()
+    _CONFIG_CACHE[key] = _build_config(y)
+    return _CONFIG_CACHE[key]
+
+
+def _build_config(y: Dict[str, Any]) -> Config:
     futwiz_cfg = _ensure_mapping(y.get("futwiz"))
     history_cfg = _ensure_mapping(y.get("history"))
     return Config(
@@ -89,16 +109,25 @@ def load_config() -> Config:
         futwiz_backoff_factor=float(futwiz_cfg.get("backoff_factor", 0.5)),
         futwiz_extra_headers=dict(futwiz_cfg.get("extra_headers", {}) or {}),
         futwiz_proxies=dict(futwiz_cfg.get("proxies", {}) or {}),
+        futwiz_parse_workers=max(0, int(futwiz_cfg.get("parse_workers", 0))),
+        futwiz_max_concurrent_pages=max(1, int(futwiz_cfg.get("max_concurrent_pages", 2))),
         history_window_minutes=max(1, int(history_cfg.get("window_minutes", 60 * 24))),
         history_max_points=max(10, int(history_cfg.get("max_points", 400))),
         history_min_points=max(1, int(history_cfg.get("min_points", 3))),
     )
 
+_COIN_TRANS = str.maketrans({",": "."})
+
 def fmt_coin(n: int) -> str:
-    return f"{n:,}".replace(",", ".")
+    return format(n, ",").translate(_COIN_TRANS)
 
 
 def _to_float(value: Any) -> Optional[float]:
+    # Caminho rápido: a maioria das linhas já chega numérica
+    if value.__class__ is float:
+        return value
+    if value.__class__ is int:
+        return float(value)
     if value in (None, ""):
         return None
     if isinstance(value, str):
@@ -125,6 +154,35 @@ def _to_float(value: Any) -> Optional[float]:
     except (TypeError, ValueError):
         return None
 
+def _column(rows: List[Dict[str, Any]], key: str, missing: float) -> np.ndarray:
+    """Return ``rows[*][key]`` as a float64 array, ``missing`` where absent."""
+
+    return np.fromiter(
+        ((_to_float(row.get(key)) or missing) for row in rows),
+        dtype=np.float64,
+        count=len(rows),
+    )
+
+_UNDERPRICED_TPL = (
+    "🟢 **UNDERPRICED** — {name} ({rating})\n"
+    "Preço: **{price}** | Esperado: {expected} (desconto ~{pct}%, z≈{score}){hist}"
+)
+_FAKE_BIN_TPL = (
+    "🟠 **FAKE BIN?** — {name} ({rating})\n"
+    "Preço: **{price}** | Média: {expected} (queda ~{pct}%){hist}"
+)
+_SPIKE_TPL = (
+    "🔵 **SPIKE** — {name} ({rating})\n"
+    "Preço: **{price}** | Média: {expected} (alta ~{pct}%){hist}"
+)
+_DEFAULT_TPL = "🔔 {badge} — {name} ({rating}) @ {price}"
+# badge -> (template, chave do percentual em ``info``)
+_ALERT_TEMPLATES = {
+    "UNDERPRICED": (_UNDERPRICED_TPL, "discount_pct"),
+    "FAKE_BIN_SUSPECT": (_FAKE_BIN_TPL, "drop_pct"),
+    "SPIKE": (_SPIKE_TPL, "spike_pct"),
+}
+
 def format_alert(row: Dict[str, Any], info: Dict[str, Any]) -> str:
     badge = info.get("type","ALERT")
     name = row.get("name","?")
@@ -135,38 +193,36 @@ def format_alert(row: Dict[str, Any], info: Dict[str, Any]) -> str:
     expected_raw = info.get("expected", price)
     expected_float = _to_float(expected_raw) or price
     expected = int(round(expected_float)) if expected_float else price
+    template = _ALERT_TEMPLATES.get(badge)
+    if template is None:
+        return _DEFAULT_TPL.format_map({"badge": badge, "name": name, "rating": rating, "price": fmt_coin(price)})
+    tpl, pct_key = template
     history_points = info.get("history_points")
-    history_suffix = (
-        f" | Hist.: {history_points} pts" if isinstance(history_points, int) and history_points > 0 else ""
-    )
-    if badge == "UNDERPRICED":
-        score = info.get('score')
-        score_fmt = score if score is not None else "--"
-        return (f"🟢 **UNDERPRICED** — {name} ({rating})\n"
-                f"Preço: **{fmt_coin(price)}** | Esperado: {fmt_coin(expected)} "
-                f"(desconto ~{int(info.get('discount_pct',0)*100)}%, z≈{score_fmt})"
-                f"{history_suffix}")
-    if badge == "FAKE_BIN_SUSPECT":
-        return (f"🟠 **FAKE BIN?** — {name} ({rating})\n"
-                f"Preço: **{fmt_coin(price)}** | Média: {fmt_coin(expected)} "
-                f"(queda ~{int(info.get('drop_pct',0)*100)}%)"
-                f"{history_suffix}")
-    if badge == "SPIKE":
-        return (f"🔵 **SPIKE** — {name} ({rating})\n"
-                f"Preço: **{fmt_coin(price)}** | Média: {fmt_coin(expected)} "
-                f"(alta ~{int(info.get('spike_pct',0)*100)}%)"
-                f"{history_suffix}")
-    return f"🔔 {badge} — {name} ({rating}) @ {fmt_coin(price)}"
-
-def maybe_notify(cfg: Config, content: str):
+    score = info.get("score")
+    return tpl.format_map({
+        "name": name,
+        "rating": rating,
+        "price": fmt_coin(price),
+        "expected": fmt_coin(expected),
+        "pct": int(info.get(pct_key, 0) * 100),
+        "score": score if score is not None else "--",
+        "hist": (
+            f" | Hist.: {history_points} pts" if isinstance(history_points, int) and history_points > 0 else ""
+        ),
+    })
+
+def maybe_notify(cfg: Config, contents: List[str]):
+    if not contents:
+        return
     if not cfg.notify_discord:
-        log.info("[ALERTA] " + content.replace("\n"," | "))
+        for content in contents:
+            log.info("[ALERTA] %s", content.replace("\n"," | "))
         return
-    ok, err = send_discord_message(content)
+    ok, err = send_discord_messages(contents)
     if not ok:
-        log.warning(f"Falha ao enviar Discord: {err}")
+        log.warning("Falha ao enviar Discord: %s", err)
     else:
-        log.info("Alerta enviado ao Discord.")
+        log.info("%s alerta(s) enviado(s) ao Discord.", len(contents))
 
 def run():
     cfg = load_config()
@@ -188,9 +244,12 @@ def run():
         cfg.futwiz_pages,
     )
     log.info("Intervalo de pooling: %ss", cfg.poll_interval_secs)
-    ucfg = UnderpricedConfig(cfg.min_discount, cfg.zscore_min)
-    fcfg = FakeBinConfig(cfg.fake_drop_pct)
-    scfg = SpikeConfig(cfg.spike_pct)
+    # Limiares fixos por execução, já especializados para o kernel
+    min_disc = cfg.min_discount
+    neg_z = -cfg.zscore_min
+    fake_drop = cfg.fake_drop_pct
+    fake_drop_plus = fake_drop + STD_NOISE_MARGIN
+    spike_thr = cfg.spike_pct
     cooldown = cfg.cooldown_minutes * 60
 
     scraper = FutwizScraper()
@@ -204,6 +263,8 @@ def run():
         backoff_factor=cfg.futwiz_backoff_factor,
         extra_headers=cfg.futwiz_extra_headers,
         proxies=cfg.futwiz_proxies,
+        parse_workers=cfg.futwiz_parse_workers,
+        max_concurrent_pages=cfg.futwiz_max_concurrent_pages,
     )
 
     while True:
@@ -213,12 +274,11 @@ def run():
                 log.warning("Scraper Futwiz não retornou dados")
                 time.sleep(cfg.poll_interval_secs)
                 continue
-            log.info(
-                f"{len(rows)} itens recebidos da Futwiz. Rodando detectores..."
-            )
+            log.info("%s itens recebidos da Futwiz. Rodando detectores...", len(rows))
 
+            scanned: List[Tuple[Dict[str, Any], str, Optional[PriceStats]]] = []
             for row in rows:
-                pid = str(row.get("player_id") or row.get("name"))
+                pid = row["_pid"]
                 price_value = _to_float(row.get("price"))
                 if price_value is None:
                     continue
@@ -230,27 +290,41 @@ def run():
                         row["avg_price_24h"] = stats.average
                     if row.get("std_24h") in (None, ""):
                         row["std_24h"] = stats.stddev
+                scanned.append((row, pid, stats))
 
-                # Detectores
-                for det_name, info in (
-                    ("UNDERPRICED", detect_underpriced(row, ucfg)),
-                    ("FAKE_BIN", detect_fake_bin(row, fcfg)),
-                    ("SPIKE", detect_spike(row, scfg)),
-                ):
-                    if not info:
-                        continue
-                    if not state.can_alert(pid, det_name, cooldown):
-                        continue
-                    if stats and stats.count:
-                        info.setdefault("history_points", stats.count)
-                    content = format_alert(row, info)
-                    maybe_notify(cfg, content)
+            # Detectores (uma passada vetorizada por rodada)
+            scanned_rows = [row for row, _, _ in scanned]
+            price = _column(scanned_rows, "price", np.nan)
+            avg = _column(scanned_rows, "avg_price_24h", np.nan)
+            # Sem preço ou média nenhum detector dispara: fora do lote
+            valid = np.flatnonzero((price > 0) & (avg > 0))
+            alerts: List[str] = []
+            if valid.size:
+                hits = evaluate_batch(
+                    price[valid],
+                    avg[valid],
+                    _column(scanned_rows, "std_24h", 0.0)[valid],
+                    min_disc,
+                    neg_z,
+                    fake_drop,
+                    fake_drop_plus,
+                    spike_thr,
+                )
+                for i in np.flatnonzero(hits.any_hit):
+                    row, pid, stats = scanned[valid[i]]
+                    for det_name, info in hits.alerts(i):
+                        if not state.can_alert(pid, det_name, cooldown):
+                            continue
+                        if stats and stats.count:
+                            info.setdefault("history_points", stats.count)
+                        alerts.append(format_alert(row, info))
+            maybe_notify(cfg, alerts)
 
         except KeyboardInterrupt:
             log.info("Encerrando...")
             break
         except Exception as e:
-            log.exception(f"Erro no loop: {e}")
+            log.exception("Erro no loop: %s", e)
 
         time.sleep(cfg.poll_interval_secs)
 
@@ -1,33 +1,105 @@
 """Discord webhook notification helper."""
 from __future__ import annotations
 
+import json
 import os
-from typing import Tuple
+import time
+from typing import Iterable, Iterator, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # pragma: no cover - depends on the environment
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
 
+# Discord aceita até 2000 caracteres por mensagem; deixamos folga.
+_MAX_PAYLOAD_CHARS = 1800
+_SEPARATOR = "\n\n"
+_MAX_RATE_LIMIT_WAIT = 30.0
 
-def send_discord_message(content: str) -> Tuple[bool, str | None]:
-    """Send ``content`` to the configured Discord webhook.
+# Sessão única: a conexão TLS com o Discord é reaproveitada entre envios.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-    Returns a tuple ``(ok, error_message)``.  When the webhook URL is not set
-    the function returns ``(False, "Webhook não configurado")``.
+
+def _dumps(content: str) -> bytes:
+    if orjson is not None:
+        return orjson.dumps({"content": content})
+    return json.dumps({"content": content}).encode("utf-8")
+
+
+def _batches(contents: Iterable[str]) -> Iterator[str]:
+    """Join ``contents`` into payloads of at most ``_MAX_PAYLOAD_CHARS``."""
+
+    batch: List[str] = []
+    size = 0
+    for content in contents:
+        extra = len(content) + (len(_SEPARATOR) if batch else 0)
+        if batch and size + extra > _MAX_PAYLOAD_CHARS:
+            yield _SEPARATOR.join(batch)
+            batch, size, extra = [], 0, len(content)
+        batch.append(content)
+        size += extra
+    if batch:
+        yield _SEPARATOR.join(batch)
+
+
+def _wait_seconds(response: requests.Response, header: str) -> float:
+    try:
+        value = float(response.headers.get(header, 1.0))
+    except (TypeError, ValueError):
+        value = 1.0
+    return min(max(value, 0.0), _MAX_RATE_LIMIT_WAIT)
+
+
+def _post(content: str) -> requests.Response:
+    # Serializado uma única vez, reaproveitado no retry do 429
+    payload = _dumps(content)
+    response = _SESSION.post(DISCORD_WEBHOOK_URL, data=payload, headers=_JSON_HEADERS, timeout=10)
+    if response.status_code == 429:
+        time.sleep(_wait_seconds(response, "Retry-After"))
+        response = _SESSION.post(DISCORD_WEBHOOK_URL, data=payload, headers=_JSON_HEADERS, timeout=10)
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        # Balde esgotado: espera o reset antes do próximo payload
+        time.sleep(_wait_seconds(response, "X-RateLimit-Reset-After"))
+    return response
+
+
+def send_discord_messages(contents: List[str]) -> Tuple[bool, str | None]:
+    """Send every item of ``contents`` using as few webhook calls as possible.
+
+    Messages are joined (separated by a blank line) into payloads that fit
+    Discord's size limit and posted over a shared session, honouring the
+    rate-limit headers.  Returns ``(ok, error_message)`` where ``error_message``
+    describes the first failed payload.
     """
 
     if not DISCORD_WEBHOOK_URL:
         return False, "Webhook não configurado"
 
-    try:
-        response = requests.post(
-            DISCORD_WEBHOOK_URL,
-            json={"content": content},
-            timeout=10,
-        )
+    error: str | None = None
+    for payload in _batches(contents):
+        try:
+            response = _post(payload)
+        except requests.RequestException as exc:  # pragma: no cover - network failures
+            error = error or str(exc)
+            continue
         if response.status_code >= 400:
-            return False, f"HTTP {response.status_code}: {response.text[:200]}"
-        return True, None
-    except requests.RequestException as exc:  # pragma: no cover - network failures
-        return False, str(exc)
+            error = error or f"HTTP {response.status_code}: {response.text[:200]}"
+    return error is None, error
+
+
+def send_discord_message(content: str) -> Tuple[bool, str | None]:
+    """Send ``content`` to the configured Discord webhook.
+
+    Returns a tuple ``(ok, error_message)``.  When the webhook URL is not set
+    the function returns ``(False, "Webhook não configurado")``.
+    """
+
+    return send_discord_messages([content])
@@ -2,20 +2,28 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import random
 import re
+import sys
+import threading
 import time
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
 import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree
 from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from urllib3.util.retry import Retry
 
+from utils.jit import HAS_NUMBA, njit
+
 _USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -30,6 +38,133 @@ _RELATIVE_TIME_RE = re.compile(
 
 log = logging.getLogger(__name__)
 
+# Teto de páginas baixadas ao mesmo tempo, somando todos os scrapers do
+# processo; ``max_concurrent_pages`` escolhe quanto disso cada rodada usa.
+_MAX_CONCURRENT_PAGES = 8
+_INFLIGHT = threading.BoundedSemaphore(_MAX_CONCURRENT_PAGES)
+
+# Conexões keep-alive por host no adapter HTTP (acima do nº de páginas simultâneas)
+_POOL_MAXSIZE = 16
+
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_SIZE = 0
+
+# Linhas da primeira tabela da página e células de cada linha
+_XP_ROWS = etree.XPath("(//table)[1]//tr")
+_XP_CELLS = etree.XPath(".//td")
+# O Futwiz serve UTF-8; os bytes da resposta vão direto para o libxml2.
+# Parser do etree (não o de lxml.html): sem lookup de classe em Python
+# para cada elemento criado.
+_HTML_PARSER = etree.HTMLParser(encoding="utf-8")
+_HAS_TABLE = re.compile(rb"<table", re.IGNORECASE).search
+# Slug de fallback do player_id: espaços viram hífens
+_SLUG_TRANS = str.maketrans({" ": "-"})
+
+# Sentinels returned by :func:`_parse_coin_nb` instead of a coin value.
+_NO_NUMBER = -1
+_TOO_LONG = -2
+
+
+@njit(cache=True)
+def _parse_coin_nb(buf: bytes) -> int:
+    """Single-pass byte scanner equivalent to the ``_PRICE_RE`` path.
+
+    Digits are accumulated into an integer while separators are counted, so
+    the thousands/decimal decision is made once at the end with the same
+    rules as :meth:`FutwizScraper._parse_coin`.  Returns ``_NO_NUMBER`` when
+    nothing parses and ``_TOO_LONG`` when the digits would overflow int64
+    (the caller then falls back to the regex path).
+    """
+
+    n = len(buf)
+    i = 0
+    while i < n and not (48 <= buf[i] <= 57):
+        i += 1
+    if i == n:
+        return _NO_NUMBER
+
+    mantissa = 0
+    digits = 0
+    frac_len = 0
+    n_dot = 0
+    n_comma = 0
+    last_sep = 0
+    suffix = 0
+    while i < n:
+        c = buf[i]
+        if c == 32:
+            i += 1
+            continue
+        if 48 <= c <= 57:
+            mantissa = mantissa * 10 + (c - 48)
+            digits += 1
+            frac_len += 1
+            i += 1
+            continue
+        if c == 46 or c == 44:
+            # Um separador só faz parte do número se vier seguido de dígito
+            j = i + 1
+            while j < n and buf[j] == 32:
+                j += 1
+            if j < n and 48 <= buf[j] <= 57:
+                if c == 46:
+                    n_dot += 1
+                else:
+                    n_comma += 1
+                last_sep = c
+                frac_len = 0
+                i = j
+                continue
+            break
+        suffix = c | 0x20
+        break
+
+    if digits > 18:
+        return _TOO_LONG
+
+    decimals = 0
+    if n_dot and n_comma:
+        if (last_sep == 46 and n_dot > 1) or (last_sep == 44 and n_comma > 1):
+            return _NO_NUMBER
+        decimals = frac_len
+    elif n_dot + n_comma == 1 and (frac_len == 1 or frac_len == 2):
+        decimals = frac_len
+
+    number = mantissa / 10.0 ** decimals
+    if suffix == 0x6B:  # k
+        number *= 1_000
+    elif suffix == 0x6D:  # m
+        number *= 1_000_000
+    elif suffix == 0x62:  # b
+        number *= 1_000_000_000
+    return int(round(number))
+
+
+_COIN_SUFFIXES = frozenset("kmb")
+
+
+def _simple_coin_number(body: str) -> Optional[str]:
+    """Normalise ``body`` when it is plain digits with at most one separator.
+
+    Mirrors the single-separator rule of :meth:`FutwizScraper._parse_coin`
+    (one or two trailing digits are decimals, otherwise thousands); returns
+    ``None`` for anything else so the caller uses the regex path.
+    """
+
+    if body.isdigit():
+        return body
+    sep = "." if "." in body else ","
+    head, found, tail = body.partition(sep)
+    if not found or not head.isdigit() or not tail.isdigit():
+        return None
+    if len(tail) in (1, 2):
+        return f"{head}.{tail}"
+    return head + tail
+
+
+# (ETag, Last-Modified) de uma resposta
+_Validators = Tuple[Optional[str], Optional[str]]
+
 
 @dataclass
 class FutwizScraperConfig:
@@ -43,6 +178,77 @@ class FutwizScraperConfig:
     retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
     extra_headers: Optional[Dict[str, str]] = None
     proxies: Optional[Dict[str, str]] = None
+    parse_workers: int = 0
+    max_concurrent_pages: int = 2
+
+
+def _new_adapter() -> HTTPAdapter:
+    return HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE)
+
+
+# Sessão padrão, compartilhada por todos os scrapers criados sem sessão
+# própria: uma única pool keep-alive (e um handshake TLS) por processo.
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = _USER_AGENT
+_SESSION_ADAPTER = _new_adapter()
+_SESSION.mount("https://", _SESSION_ADAPTER)
+_SESSION.mount("http://", _SESSION_ADAPTER)
+
+# Adapter montado em cada sessão usada por um scraper: scrapers que
+# compartilham a sessão compartilham também o adapter (e o pool).
+_SESSION_ADAPTERS: "weakref.WeakKeyDictionary[requests.Session, HTTPAdapter]" = (
+    weakref.WeakKeyDictionary()
+)
+_SESSION_ADAPTERS[_SESSION] = _SESSION_ADAPTER
+
+# Parâmetros de rede já aplicados a cada sessão (ver _configure_session);
+# por sessão, não por scraper, pois a sessão padrão é compartilhada.
+_SESSION_FINGERPRINTS: "weakref.WeakKeyDictionary[requests.Session, tuple]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool used to parse pages off the main process."""
+
+    global _PARSE_POOL, _PARSE_POOL_SIZE
+    workers = max(1, min(workers, os.cpu_count() or 1))
+    if _PARSE_POOL is None or _PARSE_POOL_SIZE != workers:
+        if _PARSE_POOL is not None:
+            _PARSE_POOL.shutdown(wait=False)
+        # spawn: o processo pai tem threads de download ativas
+        _PARSE_POOL = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        _PARSE_POOL_SIZE = workers
+    return _PARSE_POOL
+
+
+@lru_cache(maxsize=8)
+def _price_lookup(platform: str) -> Tuple[str, Tuple[str, ...]]:
+    """Return the price attribute and column titles probed for ``platform``.
+
+    Memoised per platform and handed to every ``_parse_row`` call.
+    """
+
+    price_keys = (
+        f"price ({platform})",
+        f"bin ({platform})",
+        f"{platform} lowest",
+        f"{platform} price",
+        "price",
+    )
+    return f"data-price-{platform}", price_keys
+
+
+def _cell_text(td: etree._Element) -> str:
+    """Return the stripped text chunks of ``td`` joined by single spaces."""
+
+    if not len(td):
+        # Célula folha (o caso comum): um único nó de texto
+        text = td.text
+        return text.strip() if text else ""
+    return " ".join(chunk for chunk in (text.strip() for text in td.itertext()) if chunk)
 
 
 class FutwizScraper:
@@ -51,44 +257,80 @@ class FutwizScraper:
     BASE_URL = "https://www.futwiz.com/en/fc24/players"
 
     def __init__(self, session: Optional[requests.Session] = None):
-        self.session = session or requests.Session()
-        self.session.headers.setdefault("User-Agent", _USER_AGENT)
-
-    def _parse_coin(self, text: str) -> Optional[int]:
+        # Um único adapter (e pool keep-alive) por sessão: as conexões TLS
+        # abertas são reaproveitadas entre páginas e entre rodadas.
+        if session is None:
+            self.session = _SESSION
+            self._adapter = _SESSION_ADAPTER
+        else:
+            self.session = session
+            self.session.headers.setdefault("User-Agent", _USER_AGENT)
+            # Outro scraper já montou um adapter nesta sessão: reaproveita-o,
+            # pois _configure_session só configura um adapter por sessão
+            adapter = _SESSION_ADAPTERS.get(session)
+            if adapter is None:
+                adapter = _SESSION_ADAPTERS[session] = _new_adapter()
+                self.session.mount("https://", adapter)
+                self.session.mount("http://", adapter)
+            self._adapter = adapter
+        # Validadores HTTP (ETag, Last-Modified) e linhas já parseadas por
+        # (página, plataforma), usados para GETs condicionais.
+        self._validators: Dict[Tuple[int, str], _Validators] = {}
+        self._page_rows: Dict[Tuple[int, str], List[Dict[str, object]]] = {}
+
+    @staticmethod
+    def _parse_coin(text: str) -> Optional[int]:
         text = (text or "").strip()
         if not text or text in {"-", "?"}:
             return None
 
+        if HAS_NUMBA:
+            value = _parse_coin_nb(text.encode())
+            if value >= 0:
+                return value
+            if value == _NO_NUMBER:
+                return None
+
         compact = text.replace(" ", "")
-        match = _PRICE_RE.search(compact)
-        if not match:
-            return None
+        # Caminho rápido sem regex para os formatos comuns ("15000", "12.3k",
+        # "250,000"): só dígitos ASCII, no máximo um separador e sufixo opcional
+        suffix = compact[-1].lower()
+        if suffix in _COIN_SUFFIXES:
+            body = compact[:-1]
+        else:
+            body, suffix = compact, ""
+        normalized = _simple_coin_number(body) if body.isascii() else None
 
-        number_text = match.group(1)
-        suffix = match.group(2).lower()
+        if normalized is None:
+            match = _PRICE_RE.search(compact)
+            if not match:
+                return None
 
-        if "." in number_text and "," in number_text:
-            if number_text.rfind(".") > number_text.rfind(","):
-                thousands_sep, decimal_sep = ",", "."
-            else:
-                thousands_sep, decimal_sep = ".", ","
-            normalized = number_text.replace(thousands_sep, "").replace(decimal_sep, ".")
-        elif number_text.count(",") > 1 and "." not in number_text:
-            normalized = number_text.replace(",", "")
-        elif number_text.count(".") > 1 and "," not in number_text:
-            normalized = number_text.replace(".", "")
-        else:
-            normalized = number_text
-            if "," in normalized and "." not in normalized:
-                frac_len = len(normalized) - normalized.rfind(",") - 1
-                if frac_len in (1, 2):
-                    normalized = normalized.replace(",", ".")
+            number_text = match.group(1)
+            suffix = match.group(2).lower()
+
+            if "." in number_text and "," in number_text:
+                if number_text.rfind(".") > number_text.rfind(","):
+                    thousands_sep, decimal_sep = ",", "."
                 else:
-                    normalized = normalized.replace(",", "")
-            elif "." in normalized and "," not in normalized:
-                frac_len = len(normalized) - normalized.rfind(".") - 1
-                if frac_len not in (1, 2):
-                    normalized = normalized.replace(".", "")
+                    thousands_sep, decimal_sep = ".", ","
+                normalized = number_text.replace(thousands_sep, "").replace(decimal_sep, ".")
+            elif number_text.count(",") > 1 and "." not in number_text:
+                normalized = number_text.replace(",", "")
+            elif number_text.count(".") > 1 and "," not in number_text:
+                normalized = number_text.replace(".", "")
+            else:
+                normalized = number_text
+                if "," in normalized and "." not in normalized:
+                    frac_len = len(normalized) - normalized.rfind(",") - 1
+                    if frac_len in (1, 2):
+                        normalized = normalized.replace(",", ".")
+                    else:
+                        normalized = normalized.replace(",", "")
+                elif "." in normalized and "," not in normalized:
+                    frac_len = len(normalized) - normalized.rfind(".") - 1
+                    if frac_len not in (1, 2):
+                        normalized = normalized.replace(".", "")
 
         try:
             number = float(normalized)
@@ -104,27 +346,43 @@ class FutwizScraper:
 
         return int(round(number))
 
-    def _parse_row(self, tr: Tag, platform: str) -> Optional[Dict[str, object]]:
+    @classmethod
+    def _parse_row(
+        cls,
+        tr: etree._Element,
+        price_attr: str,
+        price_keys: Tuple[str, ...],
+        now: datetime,
+    ) -> Optional[Dict[str, object]]:
         player_id = tr.get("data-playerid") or tr.get("data-id")
-        cells = tr.find_all("td")
+        cells = _XP_CELLS(tr)
         if not cells:
             return None
 
-        colmap: Dict[str, str] = {}
+        # Só os elementos são indexados aqui; o texto de cada célula é
+        # extraído sob demanda, pois com os atributos data-* presentes só
+        # rating/nome/atualização precisam dele.
+        colmap: Dict[str, object] = {}
         for td in cells:
             key = (td.get("data-title") or td.get("data-th") or "").strip().lower()
             if key:
-                colmap[key] = td.get_text(" ", strip=True)
+                colmap[key] = td
+
+        def col_text(*keys: str) -> Optional[str]:
+            for key in keys:
+                if key in colmap:
+                    return _cell_text(colmap[key])
+            return None
 
         data_price_value: Optional[int] = None
         for td in cells:
             if data_price_value is not None:
                 break
             direct_attr = td.get("data-price")
-            platform_attr = td.get(f"data-price-{platform}")
+            platform_attr = td.get(price_attr)
             raw_value = platform_attr or direct_attr
             if raw_value:
-                data_price_value = self._parse_coin(raw_value)
+                data_price_value = cls._parse_coin(raw_value)
 
         data_avg_value: Optional[int] = None
         for td in cells:
@@ -133,51 +391,41 @@ class FutwizScraper:
             direct_attr = td.get("data-average") or td.get("data-avg")
             raw_value = direct_attr
             if raw_value:
-                data_avg_value = self._parse_coin(raw_value)
-
-        texts = [td.get_text(" ", strip=True) for td in cells]
-
-        rating = colmap.get("rating") or (texts[0] if texts else None)
-        name = colmap.get("name") or colmap.get("player")
-        if name is None and len(texts) >= 2:
-            name = texts[1]
-
-        price_key_candidates = [
-            f"price ({platform})",
-            f"bin ({platform})",
-            f"{platform} lowest",
-            f"{platform} price",
-            "price",
-        ]
-        price_text = None
-        for key in price_key_candidates:
-            if key in colmap:
-                price_text = colmap[key]
-                break
-        if price_text is None and len(texts) >= 6:
-            price_text = texts[5]
+                data_avg_value = cls._parse_coin(raw_value)
+
+        rating = col_text("rating") or _cell_text(cells[0])
+        name = col_text("name") or col_text("player")
+        if name is None and len(cells) >= 2:
+            name = _cell_text(cells[1])
 
-        avg_text = colmap.get("average") or colmap.get("24h avg")
-        if avg_text is None and len(texts) >= 7:
-            avg_text = texts[6]
+        price_value = data_price_value
+        if not price_value:
+            price_text = col_text(*price_keys)
+            if price_text is None and len(cells) >= 6:
+                price_text = _cell_text(cells[5])
+            price_value = cls._parse_coin(price_text) if price_text else None
 
-        updated = colmap.get("updated") or colmap.get("last updated")
+        avg_value = data_avg_value
+        if not avg_value:
+            avg_text = col_text("average") or col_text("24h avg")
+            if avg_text is None and len(cells) >= 7:
+                avg_text = _cell_text(cells[6])
+            avg_value = cls._parse_coin(avg_text) if avg_text else None
+
+        updated = col_text("updated") or col_text("last updated")
 
         try:
             rating_value = int(rating)
         except (TypeError, ValueError):
             rating_value = None
 
-        price_value = data_price_value or (self._parse_coin(price_text) if price_text else None)
-        avg_value = data_avg_value or (self._parse_coin(avg_text) if avg_text else None)
-
         if not player_id and name:
-            player_id = name.lower().replace(" ", "-")
+            player_id = name.translate(_SLUG_TRANS).lower()
 
         if not player_id or not name or not price_value:
             return None
 
-        updated_at = self._parse_updated(updated)
+        updated_at = cls._parse_updated(updated, now)
 
         return {
             "player_id": player_id,
@@ -187,43 +435,81 @@ class FutwizScraper:
             "avg_price_24h": avg_value or price_value,
             "std_24h": None,
             "updated_at": updated_at,
+            # Chave interna (internada) usada no histórico e nos cooldowns
+            "_pid": sys.intern(str(player_id)),
         }
 
-    def _parse_page(self, html: str, platform: str) -> List[Dict[str, object]]:
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table")
-        if not table:
+    @classmethod
+    def _parse_page(cls, html: Union[bytes, str], platform: str) -> List[Dict[str, object]]:
+        if isinstance(html, str):
+            html = html.encode("utf-8")
+        # Páginas de erro/bloqueio não têm tabela: nem chegam ao parser
+        if not _HAS_TABLE(html):
+            return []
+        try:
+            tree = etree.fromstring(html, _HTML_PARSER)
+        except (etree.LxmlError, ValueError):
             return []
+        if tree is None:
+            return []
+        price_attr, price_keys = _price_lookup(platform)
+        # Um único "agora" por página para os tempos relativos das linhas
+        now = datetime.now(timezone.utc)
         rows: List[Dict[str, object]] = []
-        for tr in table.find_all("tr"):
-            data = self._parse_row(tr, platform)
+        for tr in _XP_ROWS(tree):
+            data = cls._parse_row(tr, price_attr, price_keys, now)
             if data:
                 rows.append(data)
         return rows
 
     def _configure_session(self, cfg: FutwizScraperConfig) -> None:
+        """Apply retries, headers and proxies from ``cfg`` to the session.
+
+        Settings belong to the session, not to this scraper: scrapers built
+        without a session share the process-wide ``_SESSION``, so their
+        ``extra_headers`` and ``proxies`` are merged into it and also reach
+        every other default-constructed scraper.
+        """
+
+        fingerprint = (
+            cfg.max_retries,
+            cfg.backoff_factor,
+            cfg.retry_statuses,
+            frozenset((cfg.extra_headers or {}).items()),
+            frozenset((cfg.proxies or {}).items()),
+        )
+        if _SESSION_FINGERPRINTS.get(self.session) == fingerprint:
+            return
         retry = Retry(
             total=cfg.max_retries,
             backoff_factor=cfg.backoff_factor,
             status_forcelist=cfg.retry_statuses,
             allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
         )
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        self._adapter.max_retries = retry
 
         if cfg.extra_headers:
             self.session.headers.update(cfg.extra_headers)
         if cfg.proxies:
             self.session.proxies.update(cfg.proxies)
+        _SESSION_FINGERPRINTS[self.session] = fingerprint
+
+    @staticmethod
+    def _parse_updated(text: Optional[str], now: Optional[datetime] = None) -> datetime:
+        """Turn Futwiz's "updated" cell into an aware datetime.
+
+        Relative values ("5 minutes ago") and missing ones are resolved
+        against ``now``, taken from the clock when not given.
+        """
 
-    def _parse_updated(self, text: Optional[str]) -> datetime:
+        if now is None:
+            now = datetime.now(timezone.utc)
         if not text:
-            return datetime.now(timezone.utc)
+            return now
 
         normalized = text.strip().lower()
         if normalized in {"just now", "now", "-"}:
-            return datetime.now(timezone.utc)
+            return now
 
         match = _RELATIVE_TIME_RE.search(normalized)
         if match:
@@ -238,7 +524,7 @@ class FutwizScraper:
             }
             key = delta_kwargs.get(unit, "minutes")
             delta = timedelta(**{key: value})
-            return datetime.now(timezone.utc) - delta
+            return now - delta
 
         for fmt in ("%d/%m/%Y %H:%M", "%Y-%m-%d %H:%M", "%H:%M"):
             try:
@@ -250,34 +536,149 @@ class FutwizScraper:
                     parsed = parsed.replace(tzinfo=timezone.utc)
                 return parsed
 
-        return datetime.now(timezone.utc)
+        return now
+
+    def fetch_page(
+        self, page: int, platform: str, timeout: float
+    ) -> Optional[Tuple[bytes, _Validators]]:
+        """Download ``page`` as raw bytes plus its ``(ETag, Last-Modified)``.
+
+        Returns ``None`` when the server answers 304 to a conditional GET; a
+        304 to an unconditional one raises :class:`requests.HTTPError`.  The
+        validators are not stored here: :meth:`fetch_market` saves them
+        together with the rows parsed from the body, so the two never drift
+        apart.
+        """
+
+        key = (page, platform)
+        headers: Dict[str, str] = {}
+        etag, last_modified = (
+            self._validators.get(key, (None, None)) if key in self._page_rows else (None, None)
+        )
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
 
-    def fetch_page(self, page: int, platform: str, timeout: float) -> str:
         response = self.session.get(
             self.BASE_URL,
             params={"page": page, "platform": platform},
+            headers=headers,
             timeout=timeout,
         )
+        if response.status_code == 304:
+            if headers:
+                return None
+            # 304 sem GET condicional (proxy/CDN): não há parse para reaproveitar
+            raise requests.HTTPError(
+                f"304 Not Modified sem GET condicional para a página {page}",
+                response=response,
+            )
         response.raise_for_status()
-        return response.text
+        validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return response.content, validators
+
+    def _page_delay(self, cfg: FutwizScraperConfig) -> float:
+        if not (cfg.delay_between_pages or cfg.delay_jitter):
+            return 0.0
+        base_delay = max(cfg.delay_between_pages, 0.0)
+        jitter = random.uniform(-cfg.delay_jitter, cfg.delay_jitter) if cfg.delay_jitter else 0.0
+        return max(0.0, base_delay + jitter)
+
+    def _fetch_at(
+        self, start: float, page: int, cfg: FutwizScraperConfig, stop: threading.Event
+    ) -> Optional[Tuple[bytes, _Validators]]:
+        """Wait until ``start`` (monotonic) and fetch ``page`` unless ``stop`` is set."""
+
+        if stop.wait(max(0.0, start - time.monotonic())):
+            return None
+        with _INFLIGHT:
+            if stop.is_set():
+                return None
+            return self.fetch_page(page, cfg.platform, cfg.timeout)
 
     def fetch_market(self, cfg: FutwizScraperConfig) -> List[Dict[str, object]]:
+        """Fetch and parse ``cfg.pages`` pages, stopping at the first empty one.
+
+        Requests start spaced by ``delay_between_pages`` (plus jitter) just
+        like the old sequential loop, but up to ``cfg.max_concurrent_pages``
+        (capped at ``_MAX_CONCURRENT_PAGES``) can be in flight at once and
+        each page is parsed while the next ones are still downloading.  With
+        ``cfg.parse_workers`` > 0 (and more than one page) parsing is shipped
+        to a process pool instead, so it also runs outside the GIL; empty
+        pages are then only detected once everything was fetched.
+        """
+
         self._configure_session(cfg)
         all_rows: List[Dict[str, object]] = []
-        for page in range(1, cfg.pages + 1):
-            try:
-                html = self.fetch_page(page, cfg.platform, cfg.timeout)
-            except RequestException as exc:
-                log.warning("Falha ao baixar página %s (%s): %s", page, cfg.platform, exc)
-                break
-            rows = self._parse_page(html, cfg.platform)
-            if not rows:
-                break
-            all_rows.extend(rows)
-            if cfg.delay_between_pages or cfg.delay_jitter:
-                base_delay = max(cfg.delay_between_pages, 0.0)
-                jitter = random.uniform(-cfg.delay_jitter, cfg.delay_jitter) if cfg.delay_jitter else 0.0
-                delay = max(0.0, base_delay + jitter)
-                if delay:
-                    time.sleep(delay)
+        if cfg.pages < 1:
+            return all_rows
+
+        parse_pool = None
+        if cfg.parse_workers > 0 and cfg.pages > 1:
+            parse_pool = _parse_pool(min(cfg.parse_workers, cfg.pages))
+
+        stop = threading.Event()
+        consumed = 0
+        start = time.monotonic()
+        workers = max(1, min(cfg.pages, cfg.max_concurrent_pages, _MAX_CONCURRENT_PAGES))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = []
+            for page in range(1, cfg.pages + 1):
+                futures.append(pool.submit(self._fetch_at, start, page, cfg, stop))
+                start += self._page_delay(cfg)
+
+            # (página, linhas já parseadas ou Future do pool de parse,
+            # validadores novos ou None quando a página respondeu 304)
+            pending: List[Tuple[int, object, Optional[_Validators]]] = []
+            for page, future in enumerate(futures, start=1):
+                try:
+                    fetched = future.result()
+                except RequestException as exc:
+                    log.warning("Falha ao baixar página %s (%s): %s", page, cfg.platform, exc)
+                    break
+                if fetched is None:
+                    # 304: a página não mudou, reaproveita o último parse
+                    pending.append((page, self._page_rows[(page, cfg.platform)], None))
+                    continue
+                html, validators = fetched
+                if parse_pool is not None:
+                    parsed = parse_pool.submit(type(self)._parse_page, html, cfg.platform)
+                    pending.append((page, parsed, validators))
+                else:
+                    rows = self._parse_page(html, cfg.platform)
+                    pending.append((page, rows, validators))
+                    if not rows:
+                        break
+
+            for page, parsed, validators in pending:
+                if isinstance(parsed, Future):
+                    parsed = parsed.result()
+                    # Linhas vindas do pool chegam por pickle: _pid deixa de
+                    # ser a string internada do processo pai
+                    for row in parsed:
+                        row["_pid"] = sys.intern(row["_pid"])
+                # Linhas e validadores são gravados juntos: um ETag novo
+                # nunca fica associado às linhas de uma versão antiga
+                key = (page, cfg.platform)
+                self._page_rows[key] = parsed
+                if validators is not None:
+                    if any(validators):
+                        self._validators[key] = validators
+                    else:
+                        self._validators.pop(key, None)
+                consumed = page
+                if not parsed:
+                    break
+                # Cópias: run() preenche média/desvio nas linhas
+                all_rows.extend(dict(row) for row in parsed)
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            # Páginas não consumidas (após uma vazia, uma falha ou um parse
+            # com erro) perdem o cache: a próxima rodada baixa tudo de novo
+            for page in range(consumed + 1, cfg.pages + 1):
+                self._page_rows.pop((page, cfg.platform), None)
+                self._validators.pop((page, cfg.platform), None)
         return all_rows
@@ -3,10 +3,35 @@ from __future__ import annotations
 
 import math
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Deque, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+_now = time.time
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(text: str) -> Optional[float]:
+    """Parse an ISO-8601 ``text`` (``Z`` allowed) into epoch seconds.
+
+    Naive values are taken as UTC.  Returns ``None`` when ``text`` does not
+    parse.  Cached, since the same strings come back on every poll.
+    """
+
+    text = text.strip()
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 
 @dataclass
@@ -18,19 +43,108 @@ class PriceStats:
     count: int
 
 
+@dataclass
+class _Series:
+    """Ring buffer of one player's samples plus running Welford aggregates.
+
+    Samples live in one preallocated ``(capacity, 2)`` ``float64`` array of
+    ``(timestamp, price)`` rows; ``head`` is the next write position and
+    ``count`` the number of live samples, the oldest one sitting at
+    ``head - count`` (mod capacity).
+    """
+
+    buf: np.ndarray
+    head: int = 0
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    evictions: int = 0
+
+    @classmethod
+    def with_capacity(cls, capacity: int) -> "_Series":
+        return cls(np.empty((capacity, 2), dtype=np.float64))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _oldest(self) -> int:
+        return (self.head - self.count) % self.buf.shape[0]
+
+    def oldest_ts(self) -> float:
+        return float(self.buf[self._oldest(), 0])
+
+    def push(self, ts: float, price: float) -> None:
+        head = self.head
+        self.buf[head] = (ts, price)
+        self.head = (head + 1) % self.buf.shape[0]
+        self.count += 1
+        delta = price - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (price - self.mean)
+
+    def pop(self) -> None:
+        price = float(self.buf[self._oldest(), 1])
+        self.count -= 1
+        count = self.count
+        if not count:
+            self.mean = self.m2 = 0.0
+            self.evictions = 0
+            return
+        delta = price - self.mean
+        self.mean -= delta / count
+        removed = delta * (price - self.mean)
+        self.evictions += 1
+        # Tirar um outlier cancela quase todo o m2 e deixa só erro de
+        # arredondamento: recalcula na hora em vez de esperar a janela girar
+        if (removed > 0.0 and removed >= self.m2 * 0.5) or self.evictions >= count:
+            self.resync()
+        else:
+            self.m2 -= removed
+
+    def prices(self) -> np.ndarray:
+        """Return the live prices, oldest first (a copy when wrapped)."""
+
+        capacity = self.buf.shape[0]
+        start = self._oldest()
+        end = start + self.count
+        if end <= capacity:
+            return self.buf[start:end, 1]
+        return np.concatenate((self.buf[start:, 1], self.buf[: end - capacity, 1]))
+
+    def resync(self) -> None:
+        """Recompute the aggregates exactly, discarding accumulated drift."""
+
+        if not self.count:
+            self.mean = self.m2 = 0.0
+        else:
+            prices = self.prices()
+            self.mean = float(prices.mean())
+            self.m2 = float(np.square(prices - self.mean).sum())
+        self.evictions = 0
+
+
 @dataclass
 class PriceHistory:
-    """Maintain rolling price histories per player."""
+    """Maintain rolling price histories per player.
+
+    Samples are stored in a fixed-size NumPy ring buffer per player, and each
+    series keeps a running mean and sum of squared deviations (Welford) that
+    are updated on every append and eviction, so :meth:`get_stats` is O(1)
+    instead of re-scanning the window.
+    """
 
     window_minutes: int = 60 * 24
     max_points: int = 400
-    _data: Dict[str, Deque[Tuple[float, float]]] = field(default_factory=dict, init=False)
+    _data: Dict[str, _Series] = field(default_factory=dict, init=False)
 
     def __post_init__(self) -> None:
         self.window_seconds = max(60, int(self.window_minutes) * 60)
         self.max_points = max(10, int(self.max_points))
 
     def _normalise_timestamp(self, value: object | None) -> float:
+        # O scraper entrega ``datetime`` com fuso: caso mais comum primeiro
+        if type(value) is datetime and value.tzinfo is not None:
+            return value.timestamp()
         if isinstance(value, (int, float)):
             return float(value)
         if isinstance(value, datetime):
@@ -38,31 +152,26 @@ class PriceHistory:
                 value = value.replace(tzinfo=timezone.utc)
             return value.timestamp()
         if isinstance(value, str) and value:
-            text = value.strip()
-            if text.endswith("Z"):
-                text = text[:-1] + "+00:00"
-            try:
-                dt = datetime.fromisoformat(text)
-            except ValueError:
-                return time.time()
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.timestamp()
-        return time.time()
-
-    def _trim(self, series: Deque[Tuple[float, float]], now: float) -> None:
+            ts = _parse_iso_timestamp(value)
+            return _now() if ts is None else ts
+        return _now()
+
+    def _trim(self, series: _Series, now: float) -> None:
         cutoff = now - self.window_seconds
-        while series and series[0][0] < cutoff:
-            series.popleft()
-        while len(series) > self.max_points:
-            series.popleft()
+        while series.count and series.oldest_ts() < cutoff:
+            series.pop()
+        while series.count > self.max_points:
+            series.pop()
 
     def add(self, player_id: str, price: float, updated_at: object | None = None) -> None:
         """Add a new price sample for ``player_id``."""
 
         ts = self._normalise_timestamp(updated_at)
-        series = self._data.setdefault(player_id, deque())
-        series.append((ts, float(price)))
+        series = self._data.get(player_id)
+        if series is None:
+            # +1: a amostra nova entra antes do corte em ``max_points``
+            series = self._data[player_id] = _Series.with_capacity(self.max_points + 1)
+        series.push(ts, float(price))
         self._trim(series, ts)
 
     def get_stats(self, player_id: str) -> Optional[PriceStats]:
@@ -72,23 +181,42 @@ class PriceHistory:
         if not series:
             return None
 
-        now = time.time()
+        now = _now()
         self._trim(series, now)
         if not series:
             return None
 
-        prices = [price for _, price in series]
-        count = len(prices)
-        if not count:
-            return None
-
-        avg = sum(prices) / count
-        if count == 1:
-            stddev = 0.0
-        else:
-            variance = sum((price - avg) ** 2 for price in prices) / count
-            stddev = math.sqrt(variance)
-        return PriceStats(average=avg, stddev=stddev, count=count)
+        count = len(series)
+        stddev = math.sqrt(series.m2 / count) if count > 1 else 0.0
+        return PriceStats(average=series.mean, stddev=stddev, count=count)
+
+    def get_stats_bulk(
+        self, player_ids: Sequence[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(average, stddev, count)`` arrays aligned with ``player_ids``.
+
+        Same window rules as :meth:`get_stats`, evaluated against a single
+        clock read.  Players without samples get ``NaN`` average/stddev and a
+        count of ``0``.
+        """
+
+        n = len(player_ids)
+        average = np.full(n, np.nan)
+        m2 = np.zeros(n)
+        count = np.zeros(n, dtype=np.int64)
+        now = _now()
+        for i, player_id in enumerate(player_ids):
+            series = self._data.get(player_id)
+            if series is None:
+                continue
+            self._trim(series, now)
+            if series.count:
+                average[i] = series.mean
+                m2[i] = series.m2
+                count[i] = series.count
+        stddev = np.where(count > 1, np.sqrt(m2 / np.maximum(count, 1)), 0.0)
+        stddev[count == 0] = np.nan
+        return average, stddev, count
 
     def clear(self) -> None:
         """Remove all cached history."""
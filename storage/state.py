@@ -2,21 +2,31 @@
 from __future__ import annotations
 
 import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, Tuple
+from typing import Dict
+
+# Cooldowns são intervalos relativos: relógio monotônico, imune a ajustes
+_monotonic = time.monotonic
 
 
 @dataclass
 class AlertState:
-    """Track last alert timestamps for cooldown management."""
+    """Track last alert timestamps for cooldown management.
+
+    Timestamps are ``time.monotonic`` readings grouped per detector
+    (``detector -> player_id -> ts``), so each check is a plain string
+    lookup and a detector can be reset at once.
+    """
 
-    last_alerts: Dict[Tuple[str, str], float] = field(default_factory=dict)
+    last_alerts: Dict[str, Dict[str, float]] = field(default_factory=lambda: defaultdict(dict))
 
     def can_alert(self, player_id: str, detector: str, cooldown_seconds: int) -> bool:
-        now = time.time()
-        key = (player_id, detector)
-        ts = self.last_alerts.get(key)
-        if ts and (now - ts) < cooldown_seconds:
+        now = _monotonic()
+        inner = self.last_alerts[detector]
+        ts = inner.get(player_id)
+        # ``None`` e não 0.0 como ausente: o monotônico pode começar perto de zero
+        if ts is not None and now - ts < cooldown_seconds:
             return False
-        self.last_alerts[key] = now
+        inner[player_id] = now
         return True
@@ -0,0 +1,101 @@
+"""Tests for the conditional-GET page cache of :class:`FutwizScraper`."""
+from __future__ import annotations
+
+import threading
+import unittest
+from typing import Dict, Tuple
+
+import requests
+
+from sources.futwiz_scraper import FutwizScraper, FutwizScraperConfig
+
+
+def _page(name: str, price: str) -> bytes:
+    return (
+        "<table><tr data-playerid='p1'>"
+        f"<td>90</td><td>{name}</td><td data-price='{price}'></td>"
+        "</tr></table>"
+    ).encode()
+
+
+class _FakeSession(requests.Session):
+    """Serves ``pages[page] = (body, etag)`` and honours ``If-None-Match``.
+
+    Page 1 is only answered once page 2 was, so both are always in flight.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages: Dict[int, Tuple[bytes, str]] = {}
+        self.last_served = threading.Event()
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        page = params["page"]
+        if page == 1:
+            self.last_served.wait(5)
+        body, etag = self.pages[page]
+        response = requests.Response()
+        response.url = url
+        response.headers["ETag"] = etag
+        if (headers or {}).get("If-None-Match") == etag:
+            response.status_code = 304
+        else:
+            response.status_code = 200
+            response._content = body
+        if page == max(self.pages):
+            self.last_served.set()
+        return response
+
+
+class _NotModifiedSession(requests.Session):
+    """Answers 304 to everything, like a misbehaving proxy or CDN."""
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        response = requests.Response()
+        response.url = url
+        response.status_code = 304
+        return response
+
+
+class FetchMarketCacheTest(unittest.TestCase):
+    def test_unconsumed_page_does_not_keep_new_etag_with_old_rows(self) -> None:
+        session = _FakeSession()
+        scraper = FutwizScraper(session)
+        cfg = FutwizScraperConfig(pages=2, delay_between_pages=0.0, max_retries=0)
+
+        session.pages = {1: (_page("OLD", "5k"), "a1"), 2: (_page("OLD", "5k"), "b1")}
+        rows = scraper.fetch_market(cfg)
+        self.assertEqual([row["name"] for row in rows], ["OLD", "OLD"])
+
+        # Página 1 vazia: a página 2 (com ETag novo) é baixada mas não consumida
+        session.pages = {1: (b"<html></html>", "a2"), 2: (_page("NEW", "9k"), "b2")}
+        session.last_served.clear()
+        self.assertEqual(scraper.fetch_market(cfg), [])
+
+        session.pages[1] = (_page("OLD", "5k"), "a3")
+        session.last_served.clear()
+        rows = scraper.fetch_market(cfg)
+        self.assertEqual([(row["name"], row["price"]) for row in rows], [("OLD", 5000), ("NEW", 9000)])
+
+    def test_unconditional_304_is_a_failed_page(self) -> None:
+        scraper = FutwizScraper(_NotModifiedSession())
+        cfg = FutwizScraperConfig(pages=1, delay_between_pages=0.0, max_retries=0)
+
+        with self.assertLogs("sources.futwiz_scraper", "WARNING"):
+            self.assertEqual(scraper.fetch_market(cfg), [])
+
+
+class SessionConfigTest(unittest.TestCase):
+    def test_scrapers_sharing_a_session_share_its_adapter(self) -> None:
+        session = requests.Session()
+        cfg = FutwizScraperConfig(max_retries=3)
+        FutwizScraper(session)._configure_session(cfg)
+        second = FutwizScraper(session)
+        second._configure_session(cfg)
+
+        self.assertIs(session.get_adapter("https://www.futwiz.com"), second._adapter)
+        self.assertEqual(second._adapter.max_retries.total, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Tests for :mod:`storage.price_history`."""
+from __future__ import annotations
+
+import math
+import unittest
+from unittest import mock
+
+from storage import price_history
+from storage.price_history import PriceHistory
+
+
+class PriceHistoryStatsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(price_history, "_now", return_value=1_000.0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_flat_window_after_crash_has_zero_stddev(self) -> None:
+        history = PriceHistory(max_points=400)
+        history.add("p1", 2_000_000_000, 0.0)
+        for i in range(420):
+            history.add("p1", 15_000, float(i + 1))
+
+        stats = history.get_stats("p1")
+        self.assertEqual(stats.count, 400)
+        self.assertEqual(stats.average, 15_000.0)
+        self.assertEqual(stats.stddev, 0.0)
+
+    def test_get_stats_bulk_unknown_and_single_sample(self) -> None:
+        history = PriceHistory()
+        history.add("p1", 10_000, 900.0)
+
+        average, stddev, count = history.get_stats_bulk(["missing", "p1"])
+        self.assertTrue(math.isnan(average[0]))
+        self.assertTrue(math.isnan(stddev[0]))
+        self.assertEqual(count[0], 0)
+        self.assertEqual((average[1], stddev[1], count[1]), (10_000.0, 0.0, 1))
+
+    def test_get_stats_bulk_matches_get_stats_after_trimming(self) -> None:
+        history = PriceHistory(window_minutes=1, max_points=10)
+        # Amostras de p1 fora da janela de 60 s são descartadas; p2 passa
+        # de max_points e perde as mais antigas
+        for i, price in enumerate((50_000, 12_000, 12_500, 11_800)):
+            history.add("p1", price, 900.0 + i * 20)
+        for i in range(15):
+            history.add("p2", 1_000 + 37 * i, 990.0 + i)
+
+        average, stddev, count = history.get_stats_bulk(["p1", "p2"])
+        for i, player_id in enumerate(("p1", "p2")):
+            stats = history.get_stats(player_id)
+            self.assertEqual(count[i], stats.count)
+            self.assertAlmostEqual(average[i], stats.average)
+            self.assertAlmostEqual(stddev[i], stats.stddev)
+        self.assertEqual(list(count), [2, 10])
+
+
+if __name__ == "__main__":
+    unittest.main()
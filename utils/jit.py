@@ -0,0 +1,35 @@
+"""Optional Numba integration.
+
+When :mod:`numba` is installed the decorators exported here compile the
+decorated functions to native code.  Without it they return the plain Python
+function, so every caller keeps working (only slower).
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:  # pragma: no cover - depends on the environment
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """No-op stand-in for :func:`numba.njit`."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+
+# ``fastmath`` without the ``nnan``/``ninf`` flags: NaN is used as the
+# "no z-score" marker, so LLVM must not assume it never shows up.
+FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+__all__ = ["FASTMATH", "HAS_NUMBA", "njit", "prange"]
@@ -3,11 +3,33 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Optional
+import time
+from typing import Optional, Tuple
 
 _LOG_FORMAT = "%(asctime)s | %(levelname)8s | %(message)s"
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """``logging.Formatter`` that runs ``strftime`` once per wall-clock second.
+
+    Only the default ``asctime`` layout is cached (milliseconds are still
+    appended per record); an explicit ``datefmt`` uses the stock behaviour.
+    """
+
+    _last: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        last_second, text = self._last
+        if second != last_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            # Tupla única: troca atômica mesmo com várias threads logando
+            self._last = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
 def setup_logger(name: Optional[str] = None) -> logging.Logger:
     """Configure and return a logger instance.
 
@@ -24,8 +46,11 @@ def setup_logger(name: Optional[str] = None) -> logging.Logger:
     level_name = os.getenv("LOG_LEVEL", "INFO").upper()
     level = getattr(logging, level_name, logging.INFO)
 
+    # Falhas de escrita do handler não devem imprimir traceback a cada registro
+    logging.raiseExceptions = False
+
     handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    handler.setFormatter(_CachedTimeFormatter(_LOG_FORMAT))
 
     logger.addHandler(handler)
     logger.setLevel(level)